@@ -1,45 +1,166 @@
 package dev.ps.ethblockevents.config;
 
+import com.google.common.eventbus.AsyncEventBus;
 import com.google.common.eventbus.EventBus;
+import jakarta.annotation.PreDestroy;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Qualifier;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
 import org.web3j.protocol.Web3j;
+import org.web3j.protocol.Web3jService;
+import org.web3j.protocol.core.JsonRpc2_0Web3j;
 import org.web3j.protocol.http.HttpService;
+import org.web3j.protocol.websocket.WebSocketClient;
 import org.web3j.protocol.websocket.WebSocketService;
+import org.web3j.utils.Async;
+
+import java.net.ConnectException;
+import java.net.URI;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.ThreadPoolExecutor;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicLong;
 
 @Configuration
 public class ApplicationConfig {
 
     private static final Logger logger = LoggerFactory.getLogger(ApplicationConfig.class);
+    static final int EVENT_QUEUE_CAPACITY = 10_000;
+    private static final long DROP_WARNING_INTERVAL_MS = 10_000;
+    private static final long WEBSOCKET_CONNECT_TIMEOUT_SECONDS = 10;
+
+    /**
+     * Single dispatch thread with a bounded queue, so subscribers never run on the web3j/RxJava
+     * threads that publish events. Kept private to the event bus rather than exposed as a bean,
+     * which would displace Spring Boot's default task executor.
+     */
+    private final ThreadPoolExecutor eventBusExecutor = new ThreadPoolExecutor(
+        1, 1, 0L, TimeUnit.MILLISECONDS,
+        new ArrayBlockingQueue<>(EVENT_QUEUE_CAPACITY),
+        runnable -> {
+            Thread thread = new Thread(runnable, "event-bus-dispatcher");
+            thread.setDaemon(true);
+            dispatcherThread = thread;
+            return thread;
+        },
+        this::rejectEvent
+    );
+    private volatile Thread dispatcherThread;
+    private final AtomicLong droppedEvents = new AtomicLong();
+    private final AtomicLong lastDropWarning = new AtomicLong();
 
     @Bean
     public EventBus eventBus() {
-        return new EventBus("EthereumEventBus");
+        return new AsyncEventBus("EthereumEventBus", eventBusExecutor);
+    }
+
+    @PreDestroy
+    public void shutdownEventBus() {
+        eventBusExecutor.shutdown();
+    }
+
+    /**
+     * Number of events that could not be delivered because the event bus had shut down
+     */
+    long droppedEventCount() {
+        return droppedEvents.get();
+    }
+
+    /**
+     * Blocks the publisher while the dispatch queue is full, so a backfill that outruns the
+     * subscribers is slowed down instead of losing events. A subscriber that posts from the
+     * dispatch thread runs the new event inline instead, as waiting would leave the queue with no
+     * consumer. Events posted after shutdown are dropped, counted and reported at most every
+     * {@value #DROP_WARNING_INTERVAL_MS} ms.
+     */
+    private void rejectEvent(Runnable dispatch, ThreadPoolExecutor executor) {
+        if (!executor.isShutdown()) {
+            if (Thread.currentThread() == dispatcherThread) {
+                dispatch.run();
+                return;
+            }
+            try {
+                executor.getQueue().put(dispatch);
+                return;
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+        }
+
+        long dropped = droppedEvents.incrementAndGet();
+        long now = System.currentTimeMillis();
+        long lastWarning = lastDropWarning.get();
+        if (now - lastWarning >= DROP_WARNING_INTERVAL_MS && lastDropWarning.compareAndSet(lastWarning, now)) {
+            logger.warn("Dropped event ({} dropped so far): {}", dropped,
+                       executor.isShutdown() ? "event bus is shut down" : "interrupted while waiting for the event queue");
+        }
     }
 
     @Bean
     public Web3j web3j(EthereumProperties ethereumProperties) {
         logger.info("Connecting to Ethereum node via HTTP: {}", ethereumProperties.nodeUrl());
-        return Web3j.build(new HttpService(ethereumProperties.nodeUrl()));
+        return buildWeb3j(new HttpService(ethereumProperties.nodeUrl()), ethereumProperties);
     }
 
+    /**
+     * Transport used for subscriptions: a WebSocket when one is configured and reachable,
+     * otherwise HTTP (which does not support eth_subscribe)
+     */
     @Bean
-    public Web3j web3jWebsocket(EthereumProperties ethereumProperties) {
+    public Web3jService web3jWebsocketService(EthereumProperties ethereumProperties) {
         if (ethereumProperties.websocketUrl() != null && 
             !ethereumProperties.websocketUrl().trim().isEmpty()) {
             try {
                 logger.info("Connecting to Ethereum node via WebSocket: {}", ethereumProperties.websocketUrl());
-                WebSocketService webSocketService = new WebSocketService(ethereumProperties.websocketUrl(), false);
-                webSocketService.connect();
-                return Web3j.build(webSocketService);
+                return connectWebSocket(ethereumProperties.websocketUrl(),
+                                        WEBSOCKET_CONNECT_TIMEOUT_SECONDS, TimeUnit.SECONDS);
             } catch (Exception e) {
                 logger.warn("WebSocket connection failed, falling back to HTTP: {}", ethereumProperties.nodeUrl());
-                return Web3j.build(new HttpService(ethereumProperties.nodeUrl()));
+                return new HttpService(ethereumProperties.nodeUrl());
             }
         }
         logger.info("No WebSocket URL configured, using HTTP: {}", ethereumProperties.nodeUrl());
-        return Web3j.build(new HttpService(ethereumProperties.nodeUrl()));
+        return new HttpService(ethereumProperties.nodeUrl());
+    }
+
+    @Bean
+    public Web3j web3jWebsocket(@Qualifier("web3jWebsocketService") Web3jService web3jWebsocketService,
+                                EthereumProperties ethereumProperties) {
+        return buildWeb3j(web3jWebsocketService, ethereumProperties);
+    }
+
+    /**
+     * Builds a client whose filter polling (block and log flowables over HTTP) runs at the
+     * configured block-polling-interval; it only needs to keep pace with block production
+     */
+    private static Web3j buildWeb3j(Web3jService web3jService, EthereumProperties ethereumProperties) {
+        long pollingInterval = pollingInterval(ethereumProperties);
+        logger.info("Polling filters over {} every {} ms", web3jService.getClass().getSimpleName(), pollingInterval);
+        return Web3j.build(web3jService, pollingInterval, Async.defaultExecutorService());
+    }
+
+    static long pollingInterval(EthereumProperties ethereumProperties) {
+        return ethereumProperties.blockPollingInterval() != null
+            ? ethereumProperties.blockPollingInterval()
+            : JsonRpc2_0Web3j.DEFAULT_BLOCK_TIME;
+    }
+
+    /**
+     * Connects to the WebSocket endpoint, giving up once the given timeout has passed without a
+     * completed handshake. WebSocketService#connect waits on the client with no limit, so the
+     * client bounds its own blocking connect; on timeout it aborts the pending socket itself.
+     */
+    static WebSocketService connectWebSocket(String websocketUrl, long timeout, TimeUnit unit) throws ConnectException {
+        WebSocketClient webSocketClient = new WebSocketClient(URI.create(websocketUrl)) {
+            @Override
+            public boolean connectBlocking() throws InterruptedException {
+                return connectBlocking(timeout, unit);
+            }
+        };
+        WebSocketService webSocketService = new WebSocketService(webSocketClient, false);
+        webSocketService.connect();
+        return webSocketService;
     }
-}
\ No newline at end of file
+}
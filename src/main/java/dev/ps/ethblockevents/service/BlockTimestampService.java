@@ -0,0 +1,67 @@
+package dev.ps.ethblockevents.service;
+
+import com.google.common.cache.Cache;
+import com.google.common.cache.CacheBuilder;
+import com.google.common.util.concurrent.UncheckedExecutionException;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.stereotype.Service;
+import org.web3j.protocol.Web3j;
+import org.web3j.protocol.core.DefaultBlockParameter;
+import org.web3j.protocol.core.methods.response.EthBlock;
+
+import java.io.IOException;
+import java.math.BigInteger;
+import java.time.Instant;
+import java.util.concurrent.ExecutionException;
+
+/**
+ * Resolves block timestamps, remembering recently seen blocks so that logs from the same block
+ * only cost a single eth_getBlockByNumber request
+ */
+@Service
+public class BlockTimestampService {
+
+    private static final Logger logger = LoggerFactory.getLogger(BlockTimestampService.class);
+    private static final int MAX_CACHED_BLOCKS = 8192;
+
+    private final Web3j web3j;
+    private final Cache<BigInteger, Instant> timestamps = CacheBuilder.newBuilder()
+        .maximumSize(MAX_CACHED_BLOCKS)
+        .build();
+
+    public BlockTimestampService(Web3j web3j) {
+        this.web3j = web3j;
+    }
+
+    /**
+     * Returns the timestamp of the given block, falling back to the current time if the block
+     * number is unknown or the block cannot be fetched. Concurrent lookups of the same block share a single request, and fallback
+     * values are not cached, so the next lookup retries the node.
+     *
+     * @param blockNumber The block number
+     * @return The block timestamp
+     */
+    public Instant getBlockTimestamp(BigInteger blockNumber) {
+        if (blockNumber == null) {
+            return Instant.now();
+        }
+        try {
+            return timestamps.get(blockNumber, () -> fetchBlockTimestamp(blockNumber));
+        } catch (ExecutionException | UncheckedExecutionException e) {
+            logger.warn("Failed to get block timestamp for block {}: {}", blockNumber, e.getCause().getMessage());
+            return Instant.now();
+        }
+    }
+
+    private Instant fetchBlockTimestamp(BigInteger blockNumber) throws IOException {
+        EthBlock ethBlock = web3j.ethGetBlockByNumber(
+            DefaultBlockParameter.valueOf(blockNumber), false
+        ).send();
+
+        if (ethBlock.getBlock() == null) {
+            throw new IOException("block not found");
+        }
+        return Instant.ofEpochSecond(ethBlock.getBlock().getTimestamp().longValue());
+    }
+}
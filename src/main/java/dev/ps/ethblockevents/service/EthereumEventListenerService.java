@@ -5,7 +5,9 @@ import dev.ps.ethblockevents.config.EthereumProperties;
 import dev.ps.ethblockevents.model.BlockEvent;
 import dev.ps.ethblockevents.model.ERC20TransferEvent;
 import dev.ps.ethblockevents.model.EthereumEvent;
+import io.reactivex.Flowable;
 import io.reactivex.disposables.Disposable;
+import io.reactivex.schedulers.Schedulers;
 import jakarta.annotation.PostConstruct;
 import jakarta.annotation.PreDestroy;
 import org.slf4j.Logger;
@@ -14,39 +16,62 @@ import org.springframework.beans.factory.annotation.Qualifier;
 import org.springframework.stereotype.Service;
 
 import org.web3j.protocol.Web3j;
+import org.web3j.protocol.Web3jService;
 import org.web3j.protocol.core.DefaultBlockParameter;
 import org.web3j.protocol.core.DefaultBlockParameterName;
+import org.web3j.protocol.core.Request;
 import org.web3j.protocol.core.methods.request.EthFilter;
 import org.web3j.protocol.core.methods.response.EthBlock;
+import org.web3j.protocol.core.methods.response.EthLog;
+import org.web3j.protocol.core.methods.response.EthSubscribe;
 import org.web3j.protocol.core.methods.response.Log;
+import org.web3j.protocol.websocket.events.Notification;
 
+import java.io.IOException;
 import java.math.BigInteger;
 import java.time.Instant;
 import java.util.*;
 import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicReference;
+import java.util.function.BiFunction;
 import java.util.stream.Collectors;
 
 @Service
 public class EthereumEventListenerService {
 
     private static final Logger logger = LoggerFactory.getLogger(EthereumEventListenerService.class);
+    private static final long INITIAL_LOG_RANGE = 10_000;
+    private static final long MAX_LOG_RANGE = 50_000;
+    private static final int SMALL_LOG_RESPONSE = 100;
+    private static final int MAX_LOG_REQUEST_FAILURES = 20;
+    private static final long MAX_LOG_RETRY_BACKOFF_MS = 30_000;
+    private static final int TIMESTAMP_PREFETCH_CONCURRENCY = 64;
 
     private final Web3j web3j;
     private final Web3j web3jWebsocket;
+    private final Web3jService web3jWebsocketService;
     private final EventBus eventBus;
     private final EthereumProperties ethereumProperties;
+    private final BlockTimestampService blockTimestampService;
     private final Map<String, Disposable> subscriptions = new ConcurrentHashMap<>();
     private final List<GenericContractEventListener> eventListeners;
 
+    // Delay before the first retry of a failed eth_getLogs request, doubled on each further failure
+    long logRetryBackoffMillis = 500;
+
     public EthereumEventListenerService(Web3j web3j, 
                                       @Qualifier("web3jWebsocket") Web3j web3jWebsocket,
+                                      @Qualifier("web3jWebsocketService") Web3jService web3jWebsocketService,
                                       EventBus eventBus, 
                                       EthereumProperties ethereumProperties,
+                                      BlockTimestampService blockTimestampService,
                                       List<GenericContractEventListener> eventListeners) {
         this.web3j = web3j;
         this.web3jWebsocket = web3jWebsocket;
+        this.web3jWebsocketService = web3jWebsocketService;
         this.eventBus = eventBus;
         this.ethereumProperties = ethereumProperties;
+        this.blockTimestampService = blockTimestampService;
         this.eventListeners = eventListeners.stream()
             .sorted((a, b) -> Integer.compare(b.getPriority(), a.getPriority()))
             .collect(Collectors.toList());
@@ -72,16 +97,15 @@ public class EthereumEventListenerService {
     }
 
     public void startBlockListening() {
-        if (ethereumProperties.websocketUrl() == null || 
-            ethereumProperties.websocketUrl().trim().isEmpty()) {
+        if (!isWebsocketConfigured()) {
             logger.info("WebSocket URL not configured, skipping block event listener");
             return;
         }
         
         try {
             logger.info("Starting block event listener via WebSocket");
-            
-            Disposable blockSubscription = web3jWebsocket.blockFlowable(false)
+
+            Disposable blockSubscription = newBlockFlowable()
                 .subscribe(
                     this::handleBlockEvent,
                     error -> logger.error("Error in block subscription: {}", error.getMessage(), error)
@@ -95,6 +119,25 @@ public class EthereumEventListenerService {
         }
     }
 
+    /**
+     * Streams new blocks pushed by the node through an eth_subscribe("newHeads") subscription,
+     * falling back to web3j's filter polling when the connection does not support subscriptions
+     * (e.g. the WebSocket bean fell back to HTTP).
+     */
+    private Flowable<EthBlock> newBlockFlowable() {
+        try {
+            return web3jWebsocket.newHeadsNotifications()
+                .map(notification -> notification.getParams().getResult().getHash())
+                // Notifications arrive on the WebSocket read thread, which must stay free to read
+                // the eth_getBlockByHash reply
+                .observeOn(Schedulers.io())
+                .concatMap(blockHash -> web3jWebsocket.ethGetBlockByHash(blockHash, false).flowable());
+        } catch (UnsupportedOperationException e) {
+            logger.warn("Connection does not support newHeads subscriptions, polling for new blocks instead");
+            return web3jWebsocket.blockFlowable(false);
+        }
+    }
+
     void handleBlockEvent(EthBlock ethBlock) {
         try {
             EthBlock.Block block = ethBlock.getBlock();
@@ -102,10 +145,11 @@ public class EthereumEventListenerService {
                 return;
             }
             
+            List<EthBlock.TransactionResult> transactions = block.getTransactions();
             logger.debug("Received new block: {} with {} transactions", 
-                        block.getNumber(), block.getTransactions().size());
+                        block.getNumber(), transactions.size());
             
-            List<String> transactionHashes = block.getTransactions().stream()
+            List<String> transactionHashes = transactions.stream()
                 .map(tx -> {
                     if (tx instanceof EthBlock.TransactionHash) {
                         return ((EthBlock.TransactionHash) tx).get();
@@ -125,12 +169,12 @@ public class EthereumEventListenerService {
                 Instant.ofEpochSecond(block.getTimestamp().longValue()),
                 block.getMiner(),
                 transactionHashes,
-                block.getTransactions().size()
+                transactionHashes.size()
             );
             
             eventBus.post(blockEvent);
             logger.info("Published block event for block: {} with {} transactions", 
-                       block.getNumber(), block.getTransactions().size());
+                       block.getNumber(), blockEvent.transactionCount());
             
         } catch (Exception e) {
             logger.error("Error handling block event: {}", e.getMessage(), e);
@@ -145,41 +189,112 @@ public class EthereumEventListenerService {
         logger.info("Subscribing to events for contract: {} at address: {}", 
                    contractConfig.name(), contractConfig.address());
 
-        contractConfig.events().stream()
+        // Resolve the specialized listeners for this contract once rather than per log
+        List<GenericContractEventListener> contractListeners = eventListeners.stream()
+                .filter(listener -> listener.supportsContract(contractConfig))
+                .collect(Collectors.toList());
+
+        List<EthereumProperties.EventConfig> enabledEvents = contractConfig.events().stream()
                 .filter(EthereumProperties.EventConfig::enabled)
-                .forEach(eventConfig -> subscribeToEvent(contractConfig, eventConfig));
+                .collect(Collectors.toList());
+
+        // Each polled filter costs one request per tick, so events that only filter on their
+        // signature share a single filter with the signatures OR-ed in the first topic position
+        if (!usesLogSubscription(contractConfig.blockRange())) {
+            List<EthereumProperties.EventConfig> signatureOnlyEvents = enabledEvents.stream()
+                    .filter(this::isSignatureOnly)
+                    .collect(Collectors.toList());
+
+            if (signatureOnlyEvents.size() > 1) {
+                subscribeToEvents(contractConfig, signatureOnlyEvents, contractListeners);
+                enabledEvents.removeAll(signatureOnlyEvents);
+            }
+        }
+
+        enabledEvents.forEach(eventConfig -> subscribeToEvent(contractConfig, eventConfig, contractListeners));
+    }
+
+    private boolean isSignatureOnly(EthereumProperties.EventConfig eventConfig) {
+        return eventConfig.signature() != null && !eventConfig.signature().isEmpty() &&
+               (eventConfig.topics() == null || eventConfig.topics().isEmpty());
+    }
+
+    private void subscribeToEvents(EthereumProperties.ContractConfig contractConfig,
+                                  List<EthereumProperties.EventConfig> eventConfigs,
+                                  List<GenericContractEventListener> contractListeners) {
+
+        String eventNames = eventConfigs.stream()
+                .map(EthereumProperties.EventConfig::name)
+                .collect(Collectors.joining(", "));
+
+        try {
+            EthereumProperties.BlockRange blockRange = contractConfig.blockRange();
+            DefaultBlockParameter fromBlock = getFromBlockParameter(blockRange);
+            DefaultBlockParameter toBlock = getToBlockParameter(blockRange);
+
+            // Several configs may share a signature; each still publishes its own named events
+            Map<String, List<EthereumProperties.EventConfig>> eventsBySignature = eventConfigs.stream()
+                    .collect(Collectors.groupingBy(eventConfig -> eventConfig.signature().toLowerCase()));
+
+            String[] signatures = eventsBySignature.keySet().toArray(new String[0]);
+
+            String subscriptionKey = contractConfig.address() + "_" + eventConfigs.stream()
+                    .map(EthereumProperties.EventConfig::name)
+                    .collect(Collectors.joining("_"));
+
+            Disposable subscription = withPrefetchedTimestamps(filterLogFlowable((from, to) -> {
+                    EthFilter filter = new EthFilter(from, to, contractConfig.address());
+                    filter.addOptionalTopics(signatures);
+                    return filter;
+                }, blockRange))
+                .subscribe(
+                    log -> {
+                        if (log.getTopics().isEmpty()) {
+                            return;
+                        }
+                        eventsBySignature.getOrDefault(log.getTopics().get(0).toLowerCase(), Collections.emptyList())
+                            .forEach(eventConfig -> handleLogEvent(log, contractConfig, eventConfig, contractListeners));
+                    },
+                    error -> logger.error("Error in subscription for {}: {}", subscriptionKey, error.getMessage(), error)
+                );
+
+            subscriptions.put(subscriptionKey, subscription);
+            logger.info("Successfully subscribed to events: {} for contract: {} (blocks: {} to {})", 
+                       eventNames, contractConfig.name(), fromBlock, toBlock);
+
+        } catch (Exception e) {
+            logger.error("Failed to subscribe to events: {} for contract: {}", 
+                        eventNames, contractConfig.name(), e);
+        }
     }
 
     private void subscribeToEvent(EthereumProperties.ContractConfig contractConfig, 
-                                 EthereumProperties.EventConfig eventConfig) {
+                                 EthereumProperties.EventConfig eventConfig,
+                                 List<GenericContractEventListener> contractListeners) {
         
         try {
             // Determine block range for the filter
             EthereumProperties.BlockRange blockRange = contractConfig.blockRange();
             DefaultBlockParameter fromBlock = getFromBlockParameter(blockRange);
             DefaultBlockParameter toBlock = getToBlockParameter(blockRange);
-            
-            EthFilter filter = new EthFilter(
-                fromBlock,
-                toBlock,
-                contractConfig.address()
-            );
+
+            List<String> topics = new ArrayList<>();
 
             // Add event signature as first topic
             if (eventConfig.signature() != null && !eventConfig.signature().isEmpty()) {
-                filter.addSingleTopic(eventConfig.signature());
+                topics.add(eventConfig.signature());
             }
 
             // Add additional topics if specified
             if (eventConfig.topics() != null) {
-                eventConfig.topics().forEach(filter::addSingleTopic);
+                topics.addAll(eventConfig.topics());
             }
 
             String subscriptionKey = contractConfig.address() + "_" + eventConfig.name();
             
-            Disposable subscription = web3j.ethLogFlowable(filter)
+            Disposable subscription = withPrefetchedTimestamps(logFlowable(contractConfig.address(), topics, blockRange))
                 .subscribe(
-                    log -> handleLogEvent(log, contractConfig, eventConfig),
+                    log -> handleLogEvent(log, contractConfig, eventConfig, contractListeners),
                     error -> logger.error("Error in subscription for {}: {}", subscriptionKey, error.getMessage(), error)
                 );
 
@@ -193,27 +308,218 @@ public class EthereumEventListenerService {
         }
     }
 
+    /**
+     * Resolves block timestamps for up to {@value #TIMESTAMP_PREFETCH_CONCURRENCY} logs concurrently
+     * ahead of handling, so backfilled batches don't pay one timestamp round-trip per log in series.
+     * Logs are still emitted in their original order; handlers then hit the timestamp cache.
+     */
+    private Flowable<Log> withPrefetchedTimestamps(Flowable<Log> logs) {
+        return logs.concatMapEager(log -> Flowable.fromCallable(() -> {
+                blockTimestampService.getBlockTimestamp(log.getBlockNumber());
+                return log;
+            }).subscribeOn(Schedulers.io()),
+            TIMESTAMP_PREFETCH_CONCURRENCY, 1);
+    }
+
+    /**
+     * Streams logs for the given address and topics. Live-only ranges are pushed by the node through
+     * an eth_subscribe("logs") subscription when a WebSocket is configured; historical or bounded
+     * ranges use web3j's filter polling. The WebSocket does not reconnect, so if the subscription
+     * fails (or the connection fell back to HTTP) the stream continues over HTTP: from the block of
+     * the last log received, skipping logs already delivered, or from the block after the head at
+     * the time of subscribing if no log arrived yet.
+     */
+    private Flowable<Log> logFlowable(String address, List<String> topics,
+                                      EthereumProperties.BlockRange blockRange) {
+        BiFunction<DefaultBlockParameter, DefaultBlockParameter, EthFilter> filterFactory = (from, to) -> {
+            EthFilter filter = new EthFilter(from, to, address);
+            topics.forEach(filter::addSingleTopic);
+            return filter;
+        };
+
+        if (!usesLogSubscription(blockRange)) {
+            return filterLogFlowable(filterFactory, blockRange);
+        }
+
+        return Flowable.defer(() -> {
+            BigInteger subscribedAtBlock = web3j.ethBlockNumber().send().getBlockNumber();
+            AtomicReference<Log> lastLog = new AtomicReference<>();
+            return Flowable.defer(() -> logSubscriptionFlowable(address, topics))
+                .doOnNext(log -> {
+                    if (!log.isRemoved()) {
+                        lastLog.set(log);
+                    }
+                })
+                .onErrorResumeNext(error -> {
+                    // A block's logs arrive as separate messages, so the connection may have dropped part way through one
+                    Log resumeAfter = lastLog.get();
+                    BigInteger resumeBlock = resumeAfter == null
+                        ? subscribedAtBlock.add(BigInteger.ONE)
+                        : resumeAfter.getBlockNumber();
+                    logger.warn("Log subscription for {} unavailable ({}), polling filter from block {}",
+                               address, error.getMessage(), resumeBlock);
+                    Flowable<Log> polled = filterLogFlowable(filterFactory,
+                        new EthereumProperties.BlockRange(resumeBlock.longValue(), null));
+                    return resumeAfter == null ? polled : polled.filter(log -> !isDeliveredBy(log, resumeAfter));
+                });
+        });
+    }
+
+    /**
+     * Whether the log comes at or before the given log in chain order, by block number and log index
+     */
+    private static boolean isDeliveredBy(Log log, Log delivered) {
+        int byBlock = log.getBlockNumber().compareTo(delivered.getBlockNumber());
+        if (byBlock != 0 || log.getLogIndex() == null || delivered.getLogIndex() == null) {
+            return byBlock < 0;
+        }
+        return log.getLogIndex().compareTo(delivered.getLogIndex()) <= 0;
+    }
+
+    /**
+     * Subscribes to eth_subscribe("logs"); equivalent to Web3j#logsNotifications but decoding the
+     * standard log object, so logs withdrawn by a reorg keep their removed flag
+     */
+    private Flowable<Log> logSubscriptionFlowable(String address, List<String> topics) {
+        Map<String, Object> params = new HashMap<>();
+        params.put("address", List.of(address));
+        if (!topics.isEmpty()) {
+            params.put("topics", topics);
+        }
+
+        return web3jWebsocketService.subscribe(
+                new Request<>("eth_subscribe", List.<Object>of("logs", params),
+                              web3jWebsocketService, EthSubscribe.class),
+                "eth_unsubscribe",
+                LogNotification.class)
+            .map(notification -> notification.getParams().getResult());
+    }
+
+    /**
+     * Streams logs matching the filters built by the given factory. Ranges starting at a specific
+     * block are backfilled with eth_getLogs in adaptively sized chunks up to the chain head and, when
+     * the range extends past the head, then followed live from the next block; ranges starting at
+     * latest are polled directly.
+     */
+    Flowable<Log> filterLogFlowable(
+            BiFunction<DefaultBlockParameter, DefaultBlockParameter, EthFilter> filterFactory,
+            EthereumProperties.BlockRange blockRange) {
+        if (blockRange == null || blockRange.fromBlock() == null) {
+            return web3j.ethLogFlowable(
+                filterFactory.apply(DefaultBlockParameterName.LATEST, getToBlockParameter(blockRange)));
+        }
+
+        return Flowable.defer(() -> {
+            BigInteger fromBlock = BigInteger.valueOf(blockRange.fromBlock());
+            BigInteger toBlock = blockRange.toBlock() == null ? null : BigInteger.valueOf(blockRange.toBlock());
+            BigInteger headBlock = web3j.ethBlockNumber().send().getBlockNumber();
+
+            Flowable<Log> backfill = historicalLogFlowable(filterFactory, fromBlock,
+                toBlock == null ? headBlock : toBlock.min(headBlock));
+            if (toBlock != null && toBlock.compareTo(headBlock) <= 0) {
+                return backfill;
+            }
+
+            BigInteger liveFromBlock = headBlock.add(BigInteger.ONE).max(fromBlock);
+            return backfill.concatWith(Flowable.defer(() -> web3j.ethLogFlowable(filterFactory.apply(
+                DefaultBlockParameter.valueOf(liveFromBlock), getToBlockParameter(blockRange)))));
+        }).subscribeOn(Schedulers.io());
+    }
+
+    /**
+     * Fetches logs between two blocks (inclusive) with eth_getLogs, one chunk per downstream request
+     * so a long backfill never runs ahead of its consumer
+     */
+    private Flowable<Log> historicalLogFlowable(
+            BiFunction<DefaultBlockParameter, DefaultBlockParameter, EthFilter> filterFactory,
+            BigInteger fromBlock, BigInteger toBlock) {
+        return Flowable.<List<Log>, LogRangeCursor>generate(
+                () -> new LogRangeCursor(fromBlock),
+                (cursor, emitter) -> {
+                    if (cursor.nextBlock.compareTo(toBlock) > 0) {
+                        emitter.onComplete();
+                    } else {
+                        emitter.onNext(fetchLogChunk(filterFactory, cursor, toBlock));
+                    }
+                })
+            .concatMapIterable(logs -> logs, 1);
+    }
+
+    /**
+     * Fetches the next chunk of logs for the cursor and advances it. Failed requests are retried
+     * with half the block range after an exponential backoff, giving up after
+     * {@value #MAX_LOG_REQUEST_FAILURES} consecutive failures; small responses double the range.
+     */
+    private List<Log> fetchLogChunk(
+            BiFunction<DefaultBlockParameter, DefaultBlockParameter, EthFilter> filterFactory,
+            LogRangeCursor cursor, BigInteger toBlock) throws IOException, InterruptedException {
+        int failures = 0;
+        while (true) {
+            BigInteger end = cursor.nextBlock.add(BigInteger.valueOf(cursor.range - 1)).min(toBlock);
+            try {
+                EthLog ethLog = web3j.ethGetLogs(filterFactory.apply(
+                    DefaultBlockParameter.valueOf(cursor.nextBlock), DefaultBlockParameter.valueOf(end)
+                )).send();
+                if (ethLog.hasError()) {
+                    throw new IOException(ethLog.getError().getMessage());
+                }
+
+                List<Log> logs = new ArrayList<>(ethLog.getLogs().size());
+                for (EthLog.LogResult result : ethLog.getLogs()) {
+                    logs.add((Log) result.get());
+                }
+                if (logs.size() < SMALL_LOG_RESPONSE) {
+                    cursor.range = Math.min(cursor.range * 2, MAX_LOG_RANGE);
+                }
+                cursor.nextBlock = end.add(BigInteger.ONE);
+                return logs;
+            } catch (IOException e) {
+                // Too many results, a timeout or rate limiting; wait and retry the same blocks with a smaller range
+                failures++;
+                if (failures >= MAX_LOG_REQUEST_FAILURES) {
+                    throw e;
+                }
+                cursor.range = Math.max(cursor.range / 2, 1);
+                long backoff = Math.min(logRetryBackoffMillis << Math.min(failures - 1, 16), MAX_LOG_RETRY_BACKOFF_MS);
+                logger.debug("Log request for blocks {} to {} failed ({}), retrying in {} ms with {} blocks",
+                            cursor.nextBlock, end, e.getMessage(), backoff, cursor.range);
+                Thread.sleep(backoff);
+            }
+        }
+    }
+
+    private boolean usesLogSubscription(EthereumProperties.BlockRange blockRange) {
+        return isWebsocketConfigured()
+            && getFromBlockParameter(blockRange) == DefaultBlockParameterName.LATEST
+            && getToBlockParameter(blockRange) == DefaultBlockParameterName.LATEST;
+    }
+
     private void handleLogEvent(Log log, EthereumProperties.ContractConfig contractConfig, 
-                               EthereumProperties.EventConfig eventConfig) {
+                               EthereumProperties.EventConfig eventConfig,
+                               List<GenericContractEventListener> contractListeners) {
         try {
+            if (log.isRemoved()) {
+                logger.info("Skipping {} log removed by chain reorganization in tx: {}",
+                           eventConfig.name(), log.getTransactionHash());
+                return;
+            }
+
             logger.debug("Received log event: {} for contract: {}", eventConfig.name(), contractConfig.name());
 
             // First, try specialized listeners
             boolean handled = false;
-            for (GenericContractEventListener listener : eventListeners) {
-                if (listener.supportsContract(contractConfig)) {
-                    handled = listener.handleEvent(log, contractConfig, eventConfig);
-                    if (handled) {
-                        logger.debug("Event handled by specialized listener: {}", listener.getClass().getSimpleName());
-                        break;
-                    }
+            for (GenericContractEventListener listener : contractListeners) {
+                handled = listener.handleEvent(log, contractConfig, eventConfig);
+                if (handled) {
+                    logger.debug("Event handled by specialized listener: {}", listener.getClass().getSimpleName());
+                    break;
                 }
             }
 
             // If no specialized listener handled it, create a generic event
             if (!handled) {
                 // Get block timestamp
-                Instant timestamp = getBlockTimestamp(log.getBlockNumber());
+                Instant timestamp = blockTimestampService.getBlockTimestamp(log.getBlockNumber());
 
                 // Create generic Ethereum event
                 EthereumEvent ethereumEvent = new EthereumEvent(
@@ -288,19 +594,9 @@ public class EthereumEventListenerService {
         }
     }
 
-    private Instant getBlockTimestamp(BigInteger blockNumber) {
-        try {
-            EthBlock ethBlock = web3j.ethGetBlockByNumber(
-                org.web3j.protocol.core.DefaultBlockParameter.valueOf(blockNumber), false
-            ).send();
-            
-            if (ethBlock.getBlock() != null) {
-                return Instant.ofEpochSecond(ethBlock.getBlock().getTimestamp().longValue());
-            }
-        } catch (Exception e) {
-            logger.warn("Failed to get block timestamp for block {}: {}", blockNumber, e.getMessage());
-        }
-        return Instant.now();
+    private boolean isWebsocketConfigured() {
+        return ethereumProperties.websocketUrl() != null && 
+               !ethereumProperties.websocketUrl().trim().isEmpty();
     }
     
     /**
@@ -330,4 +626,22 @@ public class EthereumEventListenerService {
         logger.info("Dynamically adding contract: {} at {}", contractConfig.name(), contractConfig.address());
         subscribeToContractEvents(contractConfig);
     }
-}
\ No newline at end of file
+
+    /**
+     * Position of an eth_getLogs backfill: the next block to fetch and the current chunk size
+     */
+    private static final class LogRangeCursor {
+        private BigInteger nextBlock;
+        private long range = INITIAL_LOG_RANGE;
+
+        private LogRangeCursor(BigInteger nextBlock) {
+            this.nextBlock = nextBlock;
+        }
+    }
+
+    /**
+     * Notification for eth_subscribe("logs") carrying the standard log object
+     */
+    static class LogNotification extends Notification<Log> {
+    }
+}
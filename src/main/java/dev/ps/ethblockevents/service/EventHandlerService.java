@@ -12,6 +12,7 @@ import jakarta.annotation.PostConstruct;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.stereotype.Service;
+import org.web3j.utils.Numeric;
 
 /**
  * Example service that demonstrates how to handle events published to the EventBus
@@ -71,12 +72,14 @@ public class EventHandlerService {
     
     @Subscribe
     public void handleUniswapSwapEvent(UniswapSwapEvent event) {
-        logger.info("Received Uniswap Swap: pool {} traded {} <-> {} by {} (tx: {})", 
-                   bytesToHex(event.poolId()),
-                   event.amount0(), 
-                   event.amount1(),
-                   event.sender(),
-                   event.transactionHash());
+        if (logger.isInfoEnabled()) {
+            logger.info("Received Uniswap Swap: pool {} traded {} <-> {} by {} (tx: {})", 
+                       Numeric.toHexString(event.poolId()),
+                       event.amount0(), 
+                       event.amount1(),
+                       event.sender(),
+                       event.transactionHash());
+        }
         
         // Add your custom logic here to handle Uniswap swap events
         // For example: track trading volumes, analyze price impacts, monitor specific pools, etc.
@@ -84,12 +87,14 @@ public class EventHandlerService {
     
     @Subscribe
     public void handleUniswapInitializeEvent(UniswapInitializeEvent event) {
-        logger.info("Received Uniswap Initialize: new pool {} for currencies {} <-> {} (fee: {}, tx: {})", 
-                   bytesToHex(event.poolId()),
-                   event.currency0(), 
-                   event.currency1(),
-                   event.fee(),
-                   event.transactionHash());
+        if (logger.isInfoEnabled()) {
+            logger.info("Received Uniswap Initialize: new pool {} for currencies {} <-> {} (fee: {}, tx: {})", 
+                       Numeric.toHexString(event.poolId()),
+                       event.currency0(), 
+                       event.currency1(),
+                       event.fee(),
+                       event.transactionHash());
+        }
         
         // Add your custom logic here to handle Uniswap pool initialization events
         // For example: track new pools, analyze fee structures, monitor specific currency pairs, etc.
@@ -97,23 +102,17 @@ public class EventHandlerService {
     
     @Subscribe
     public void handleUniswapModifyLiquidityEvent(UniswapModifyLiquidityEvent event) {
-        logger.info("Received Uniswap ModifyLiquidity: pool {} liquidity changed by {} (ticks: {}-{}, sender: {}, tx: {})", 
-                   bytesToHex(event.poolId()),
-                   event.liquidityDelta(),
-                   event.tickLower(),
-                   event.tickUpper(),
-                   event.sender(),
-                   event.transactionHash());
+        if (logger.isInfoEnabled()) {
+            logger.info("Received Uniswap ModifyLiquidity: pool {} liquidity changed by {} (ticks: {}-{}, sender: {}, tx: {})", 
+                       Numeric.toHexString(event.poolId()),
+                       event.liquidityDelta(),
+                       event.tickLower(),
+                       event.tickUpper(),
+                       event.sender(),
+                       event.transactionHash());
+        }
         
         // Add your custom logic here to handle Uniswap liquidity modification events
         // For example: track liquidity changes, analyze LP activity, monitor specific ranges, etc.
     }
-    
-    private String bytesToHex(byte[] bytes) {
-        StringBuilder result = new StringBuilder("0x");
-        for (byte b : bytes) {
-            result.append(String.format("%02x", b));
-        }
-        return result.toString();
-    }
 }
\ No newline at end of file
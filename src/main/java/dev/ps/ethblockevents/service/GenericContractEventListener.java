@@ -9,7 +9,8 @@ import org.web3j.protocol.core.methods.response.Log;
 public interface GenericContractEventListener {
     
     /**
-     * Handles a generic log event and can perform specific processing based on the event type
+     * Handles a generic log event and can perform specific processing based on the event type.
+     * Only called for contracts this listener {@link #supportsContract supports}.
      * 
      * @param log The raw log event from the blockchain
      * @param contractConfig The contract configuration
@@ -2,20 +2,23 @@ package dev.ps.ethblockevents.service;
 
 import com.google.common.eventbus.EventBus;
 import dev.ps.ethblockevents.config.EthereumProperties;
+import dev.ps.ethblockevents.contracts.IUniswapV4Events;
 import dev.ps.ethblockevents.model.UniswapInitializeEvent;
 import dev.ps.ethblockevents.model.UniswapModifyLiquidityEvent;
 import dev.ps.ethblockevents.model.UniswapSwapEvent;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.stereotype.Component;
-import org.web3j.protocol.Web3j;
-import org.web3j.protocol.core.DefaultBlockParameter;
-import org.web3j.protocol.core.methods.response.EthBlock;
+import org.web3j.abi.FunctionReturnDecoder;
+import org.web3j.abi.TypeReference;
+import org.web3j.abi.datatypes.Type;
 import org.web3j.protocol.core.methods.response.Log;
+import org.web3j.utils.Numeric;
 
 import java.math.BigInteger;
 import java.time.Instant;
 import java.util.List;
+import java.util.Set;
 
 /**
  * Specialized event listener for Uniswap V4 contract events
@@ -25,25 +28,37 @@ public class UniswapEventListener implements GenericContractEventListener {
     
     private static final Logger logger = LoggerFactory.getLogger(UniswapEventListener.class);
     
+    private static final Set<String> UNISWAP_TOPICS = Set.of(
+        UniswapSwapEvent.TOPIC_0,
+        UniswapInitializeEvent.TOPIC_0,
+        UniswapModifyLiquidityEvent.TOPIC_0
+    );
+    
+    private static final String ZERO_ADDRESS = "0x0000000000000000000000000000000000000000";
+    
+    // Non-indexed parameter layouts, taken once from the generated contract wrapper
+    private static final List<TypeReference<Type>> SWAP_PARAMETERS =
+        IUniswapV4Events.SWAP_EVENT.getNonIndexedParameters();
+    private static final List<TypeReference<Type>> INITIALIZE_PARAMETERS =
+        IUniswapV4Events.INITIALIZE_EVENT.getNonIndexedParameters();
+    private static final List<TypeReference<Type>> MODIFY_LIQUIDITY_PARAMETERS =
+        IUniswapV4Events.MODIFY_LIQUIDITY_EVENT.getNonIndexedParameters();
+    
     private final EventBus eventBus;
-    private final Web3j web3j;
+    private final BlockTimestampService blockTimestampService;
     
-    public UniswapEventListener(EventBus eventBus, Web3j web3j) {
+    public UniswapEventListener(EventBus eventBus, BlockTimestampService blockTimestampService) {
         this.eventBus = eventBus;
-        this.web3j = web3j;
+        this.blockTimestampService = blockTimestampService;
     }
     
     @Override
     public boolean handleEvent(Log log, EthereumProperties.ContractConfig contractConfig, 
                               EthereumProperties.EventConfig eventConfig) {
         
-        if (!supportsContract(contractConfig)) {
-            return false;
-        }
-        
         try {
             String eventSignature = log.getTopics().get(0);
-            Instant timestamp = getBlockTimestamp(log.getBlockNumber());
+            Instant timestamp = blockTimestampService.getBlockTimestamp(log.getBlockNumber());
             
             switch (eventSignature) {
                 case UniswapSwapEvent.TOPIC_0:
@@ -75,9 +90,7 @@ public class UniswapEventListener implements GenericContractEventListener {
         return contractConfig.name() != null && 
                (contractConfig.name().toLowerCase().contains("uniswap") ||
                 contractConfig.events().stream().anyMatch(event -> 
-                    UniswapSwapEvent.TOPIC_0.equals(event.signature()) ||
-                    UniswapInitializeEvent.TOPIC_0.equals(event.signature()) ||
-                    UniswapModifyLiquidityEvent.TOPIC_0.equals(event.signature())
+                    event.signature() != null && UNISWAP_TOPICS.contains(event.signature())
                 ));
     }
     
@@ -94,20 +107,21 @@ public class UniswapEventListener implements GenericContractEventListener {
             }
             
             // Extract indexed parameters
-            byte[] poolId = hexStringToByteArray(log.getTopics().get(1));
+            byte[] poolId = Numeric.hexStringToByteArray(log.getTopics().get(1));
             String sender = "0x" + log.getTopics().get(2).substring(26);
             
-            // For now, create event with basic data and null for complex decoded fields
-            // TODO: Implement proper ABI decoding
+            // Decode non-indexed parameters: amount0, amount1, sqrtPriceX96, liquidity, tick
+            List<Type> values = FunctionReturnDecoder.decode(log.getData(), SWAP_PARAMETERS);
+            
             UniswapSwapEvent swapEvent = new UniswapSwapEvent(
                 log.getAddress(),
                 poolId,
                 sender,
-                BigInteger.ZERO, // amount0 - TODO: decode from data
-                BigInteger.ZERO, // amount1 - TODO: decode from data  
-                BigInteger.ZERO, // sqrtPriceX96 - TODO: decode from data
-                BigInteger.ZERO, // liquidity - TODO: decode from data
-                BigInteger.ZERO, // tick - TODO: decode from data
+                integerAt(values, 0),
+                integerAt(values, 1),
+                integerAt(values, 2),
+                integerAt(values, 3),
+                integerAt(values, 4),
                 log.getTransactionHash(),
                 log.getBlockNumber(),
                 log.getLogIndex(),
@@ -115,8 +129,10 @@ public class UniswapEventListener implements GenericContractEventListener {
             );
             
             eventBus.post(swapEvent);
-            logger.info("Published Uniswap Swap event for pool: {} by sender: {} (detailed decoding pending)", 
-                       bytesToHex(poolId), sender);
+            if (logger.isInfoEnabled()) {
+                logger.info("Published Uniswap Swap event for pool: {} by sender: {}", 
+                           Numeric.toHexString(poolId), sender);
+            }
             
         } catch (Exception e) {
             logger.error("Error handling Uniswap Swap event: {}", e.getMessage(), e);
@@ -131,20 +147,21 @@ public class UniswapEventListener implements GenericContractEventListener {
             }
             
             // Extract indexed parameters
-            byte[] poolId = hexStringToByteArray(log.getTopics().get(1));
+            byte[] poolId = Numeric.hexStringToByteArray(log.getTopics().get(1));
             String currency0 = "0x" + log.getTopics().get(2).substring(26);
             String currency1 = "0x" + log.getTopics().get(3).substring(26);
             
-            // For now, create event with basic data and defaults for complex decoded fields
-            // TODO: Implement proper ABI decoding
+            // Decode non-indexed parameters: fee, tickSpacing, hooks
+            List<Type> values = FunctionReturnDecoder.decode(log.getData(), INITIALIZE_PARAMETERS);
+            
             UniswapInitializeEvent initEvent = new UniswapInitializeEvent(
                 log.getAddress(),
                 poolId,
                 currency0,
                 currency1,
-                BigInteger.ZERO, // fee - TODO: decode from data
-                BigInteger.ZERO, // tickSpacing - TODO: decode from data
-                "0x0000000000000000000000000000000000000000", // hooks - TODO: decode from data
+                integerAt(values, 0),
+                integerAt(values, 1),
+                values.size() > 2 ? (String) values.get(2).getValue() : ZERO_ADDRESS,
                 log.getTransactionHash(),
                 log.getBlockNumber(),
                 log.getLogIndex(),
@@ -152,8 +169,10 @@ public class UniswapEventListener implements GenericContractEventListener {
             );
             
             eventBus.post(initEvent);
-            logger.info("Published Uniswap Initialize event for pool: {} with currencies: {} <-> {} (detailed decoding pending)", 
-                       bytesToHex(poolId), currency0, currency1);
+            if (logger.isInfoEnabled()) {
+                logger.info("Published Uniswap Initialize event for pool: {} with currencies: {} <-> {}", 
+                           Numeric.toHexString(poolId), currency0, currency1);
+            }
             
         } catch (Exception e) {
             logger.error("Error handling Uniswap Initialize event: {}", e.getMessage(), e);
@@ -168,18 +187,19 @@ public class UniswapEventListener implements GenericContractEventListener {
             }
             
             // Extract indexed parameters
-            byte[] poolId = hexStringToByteArray(log.getTopics().get(1));
+            byte[] poolId = Numeric.hexStringToByteArray(log.getTopics().get(1));
             String sender = "0x" + log.getTopics().get(2).substring(26);
             
-            // For now, create event with basic data and defaults for complex decoded fields
-            // TODO: Implement proper ABI decoding
+            // Decode non-indexed parameters: tickLower, tickUpper, liquidityDelta
+            List<Type> values = FunctionReturnDecoder.decode(log.getData(), MODIFY_LIQUIDITY_PARAMETERS);
+            
             UniswapModifyLiquidityEvent modifyEvent = new UniswapModifyLiquidityEvent(
                 log.getAddress(),
                 poolId,
                 sender,
-                BigInteger.ZERO, // tickLower - TODO: decode from data
-                BigInteger.ZERO, // tickUpper - TODO: decode from data
-                BigInteger.ZERO, // liquidityDelta - TODO: decode from data
+                integerAt(values, 0),
+                integerAt(values, 1),
+                integerAt(values, 2),
                 log.getTransactionHash(),
                 log.getBlockNumber(),
                 log.getLogIndex(),
@@ -187,47 +207,20 @@ public class UniswapEventListener implements GenericContractEventListener {
             );
             
             eventBus.post(modifyEvent);
-            logger.info("Published Uniswap ModifyLiquidity event for pool: {} by sender: {} (detailed decoding pending)", 
-                       bytesToHex(poolId), sender);
+            if (logger.isInfoEnabled()) {
+                logger.info("Published Uniswap ModifyLiquidity event for pool: {} by sender: {}", 
+                           Numeric.toHexString(poolId), sender);
+            }
             
         } catch (Exception e) {
             logger.error("Error handling Uniswap ModifyLiquidity event: {}", e.getMessage(), e);
         }
     }
     
-    private Instant getBlockTimestamp(BigInteger blockNumber) {
-        try {
-            EthBlock ethBlock = web3j.ethGetBlockByNumber(
-                DefaultBlockParameter.valueOf(blockNumber), false
-            ).send();
-            
-            if (ethBlock.getBlock() != null) {
-                return Instant.ofEpochSecond(ethBlock.getBlock().getTimestamp().longValue());
-            }
-        } catch (Exception e) {
-            logger.warn("Failed to get block timestamp for block {}: {}", blockNumber, e.getMessage());
-        }
-        return Instant.now();
-    }
-    
-    private byte[] hexStringToByteArray(String hex) {
-        // Remove 0x prefix if present
-        hex = hex.startsWith("0x") ? hex.substring(2) : hex;
-        
-        int len = hex.length();
-        byte[] data = new byte[len / 2];
-        for (int i = 0; i < len; i += 2) {
-            data[i / 2] = (byte) ((Character.digit(hex.charAt(i), 16) << 4)
-                                 + Character.digit(hex.charAt(i+1), 16));
-        }
-        return data;
-    }
-    
-    private String bytesToHex(byte[] bytes) {
-        StringBuilder result = new StringBuilder("0x");
-        for (byte b : bytes) {
-            result.append(String.format("%02x", b));
-        }
-        return result.toString();
+    /**
+     * Returns the decoded integer at the given position, or zero when the log carried no data
+     */
+    private static BigInteger integerAt(List<Type> values, int index) {
+        return values.size() > index ? (BigInteger) values.get(index).getValue() : BigInteger.ZERO;
     }
 }
\ No newline at end of file
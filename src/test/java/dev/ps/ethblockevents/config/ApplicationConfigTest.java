@@ -0,0 +1,206 @@
+package dev.ps.ethblockevents.config;
+
+import com.google.common.eventbus.EventBus;
+import com.google.common.eventbus.Subscribe;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.boot.context.properties.bind.Binder;
+import org.springframework.boot.context.properties.source.ConfigurationPropertySources;
+import org.springframework.boot.env.YamlPropertySourceLoader;
+import org.springframework.core.env.PropertySource;
+import org.springframework.core.io.ClassPathResource;
+import org.web3j.protocol.core.JsonRpc2_0Web3j;
+
+import java.io.IOException;
+import java.net.ConnectException;
+import java.net.ServerSocket;
+import java.time.Duration;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.CopyOnWriteArrayList;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.TimeUnit;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+class ApplicationConfigTest {
+
+    private ApplicationConfig config;
+
+    @BeforeEach
+    void setUp() {
+        config = new ApplicationConfig();
+    }
+
+    @AfterEach
+    void tearDown() {
+        config.shutdownEventBus();
+    }
+
+    @Test
+    void testEventBus_deliversOnDispatcherThread() throws InterruptedException {
+        // Given
+        EventBus eventBus = config.eventBus();
+        RecordingSubscriber subscriber = new RecordingSubscriber(1, null);
+        eventBus.register(subscriber);
+
+        // When
+        eventBus.post("event");
+
+        // Then
+        assertTrue(subscriber.received.await(5, TimeUnit.SECONDS));
+        assertEquals(List.of("event-bus-dispatcher"), subscriber.threads);
+    }
+
+    @Test
+    void testEventBus_blocksPublisherInsteadOfDroppingWhenQueueFull() throws InterruptedException {
+        // Given
+        int eventCount = ApplicationConfig.EVENT_QUEUE_CAPACITY + 2;
+        CountDownLatch release = new CountDownLatch(1);
+        EventBus eventBus = config.eventBus();
+        RecordingSubscriber subscriber = new RecordingSubscriber(eventCount, release);
+        eventBus.register(subscriber);
+
+        // When
+        Thread publisher = new Thread(() -> {
+            for (int i = 0; i < eventCount; i++) {
+                eventBus.post(i);
+            }
+        });
+        publisher.start();
+        publisher.join(500);
+
+        // Then
+        assertTrue(publisher.isAlive(), "publisher should wait while the queue is full");
+        release.countDown();
+        publisher.join(5000);
+        assertTrue(subscriber.received.await(5, TimeUnit.SECONDS));
+        assertEquals(0, config.droppedEventCount());
+    }
+
+    @Test
+    void testEventBus_runsRepostFromSubscriberInlineWhenQueueFull() throws InterruptedException {
+        // Given: the dispatcher is busy with the first event while the publisher fills the queue
+        int eventCount = ApplicationConfig.EVENT_QUEUE_CAPACITY + 1;
+        CountDownLatch queueFull = new CountDownLatch(1);
+        EventBus eventBus = config.eventBus();
+        RepostingSubscriber subscriber = new RepostingSubscriber(eventBus, eventCount, queueFull);
+        eventBus.register(subscriber);
+
+        // When
+        for (int i = 0; i < eventCount; i++) {
+            eventBus.post(i);
+        }
+        queueFull.countDown();
+
+        // Then
+        assertTrue(subscriber.reposted.await(5, TimeUnit.SECONDS), "re-posted event should not deadlock the dispatcher");
+        assertTrue(subscriber.received.await(5, TimeUnit.SECONDS));
+        assertEquals(0, config.droppedEventCount());
+    }
+
+    @Test
+    void testEventBus_countsEventsPostedAfterShutdown() {
+        // Given
+        EventBus eventBus = config.eventBus();
+        eventBus.register(new RecordingSubscriber(1, null));
+        config.shutdownEventBus();
+
+        // When
+        eventBus.post("late");
+        eventBus.post("later");
+
+        // Then
+        assertEquals(2, config.droppedEventCount());
+    }
+
+    @Test
+    void testPollingInterval_bindsApplicationYmlDefault() throws IOException {
+        // Given
+        List<PropertySource<?>> sources = new YamlPropertySourceLoader()
+            .load("application", new ClassPathResource("application.yml"));
+        EthereumProperties properties = new Binder(ConfigurationPropertySources.from(sources))
+            .bind("ethereum", EthereumProperties.class)
+            .get();
+
+        // When
+        long pollingInterval = ApplicationConfig.pollingInterval(properties);
+
+        // Then
+        assertEquals(12_000L, pollingInterval);
+    }
+
+    @Test
+    void testPollingInterval_fallsBackToWeb3jDefault() {
+        // Given
+        EthereumProperties properties = new EthereumProperties(
+            "http://localhost:8545", null, null, null, Collections.emptyList());
+
+        // When
+        long pollingInterval = ApplicationConfig.pollingInterval(properties);
+
+        // Then
+        assertEquals(JsonRpc2_0Web3j.DEFAULT_BLOCK_TIME, pollingInterval);
+    }
+
+    @Test
+    void testConnectWebSocket_givesUpOnUnresponsiveEndpoint() throws IOException {
+        // Given: a socket that accepts connections but never answers the WebSocket handshake
+        try (ServerSocket server = new ServerSocket(0)) {
+            String websocketUrl = "ws://127.0.0.1:" + server.getLocalPort();
+
+            // When / Then
+            assertTimeoutPreemptively(Duration.ofSeconds(5), () ->
+                assertThrows(ConnectException.class, () ->
+                    ApplicationConfig.connectWebSocket(websocketUrl, 200, TimeUnit.MILLISECONDS)));
+        }
+    }
+
+    static class RecordingSubscriber {
+        final CountDownLatch received;
+        final List<String> threads = new CopyOnWriteArrayList<>();
+        private final CountDownLatch release;
+
+        RecordingSubscriber(int expectedEvents, CountDownLatch release) {
+            this.received = new CountDownLatch(expectedEvents);
+            this.release = release;
+        }
+
+        @Subscribe
+        public void onEvent(Object event) throws InterruptedException {
+            if (release != null) {
+                release.await();
+            }
+            threads.add(Thread.currentThread().getName());
+            received.countDown();
+        }
+    }
+
+    static class RepostingSubscriber {
+        final CountDownLatch received;
+        final CountDownLatch reposted = new CountDownLatch(1);
+        private final EventBus eventBus;
+        private final CountDownLatch queueFull;
+
+        RepostingSubscriber(EventBus eventBus, int expectedEvents, CountDownLatch queueFull) {
+            this.received = new CountDownLatch(expectedEvents);
+            this.eventBus = eventBus;
+            this.queueFull = queueFull;
+        }
+
+        @Subscribe
+        public void onNumber(Integer event) throws InterruptedException {
+            if (event == 0) {
+                queueFull.await();
+                eventBus.post("reposted");
+            }
+            received.countDown();
+        }
+
+        @Subscribe
+        public void onRepost(String event) {
+            reposted.countDown();
+        }
+    }
+}
@@ -0,0 +1,114 @@
+package dev.ps.ethblockevents.service;
+
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.mockito.Mock;
+import org.mockito.MockitoAnnotations;
+import org.web3j.protocol.Web3j;
+import org.web3j.protocol.core.Request;
+import org.web3j.protocol.core.methods.response.EthBlock;
+
+import java.io.IOException;
+import java.math.BigInteger;
+import java.time.Instant;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.TimeUnit;
+
+import static org.junit.jupiter.api.Assertions.*;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.eq;
+import static org.mockito.Mockito.*;
+
+class BlockTimestampServiceTest {
+
+    @Mock
+    private Web3j web3j;
+
+    @Mock
+    private Request request;
+
+    private BlockTimestampService service;
+
+    @BeforeEach
+    void setUp() {
+        MockitoAnnotations.openMocks(this);
+        doReturn(request).when(web3j).ethGetBlockByNumber(any(), eq(false));
+        service = new BlockTimestampService(web3j);
+    }
+
+    @Test
+    void testGetBlockTimestamp_cachesPerBlock() throws IOException {
+        // Given
+        EthBlock.Block block = mock(EthBlock.Block.class);
+        EthBlock ethBlock = mock(EthBlock.class);
+        when(ethBlock.getBlock()).thenReturn(block);
+        when(block.getTimestamp()).thenReturn(BigInteger.valueOf(1640995200));
+        when(request.send()).thenReturn(ethBlock);
+
+        // When
+        Instant first = service.getBlockTimestamp(BigInteger.valueOf(12345));
+        Instant second = service.getBlockTimestamp(BigInteger.valueOf(12345));
+
+        // Then
+        assertEquals(Instant.ofEpochSecond(1640995200), first);
+        assertEquals(first, second);
+        verify(web3j, times(1)).ethGetBlockByNumber(any(), eq(false));
+    }
+
+    @Test
+    void testGetBlockTimestamp_doesNotCacheFailures() throws IOException {
+        // Given
+        when(request.send()).thenThrow(new IOException("node unavailable"));
+
+        // When
+        service.getBlockTimestamp(BigInteger.valueOf(12345));
+        service.getBlockTimestamp(BigInteger.valueOf(12345));
+
+        // Then
+        verify(web3j, times(2)).ethGetBlockByNumber(any(), eq(false));
+    }
+
+    @Test
+    void testGetBlockTimestamp_fallsBackToNowForUnknownBlock() {
+        // Given
+        Instant before = Instant.now();
+
+        // When
+        Instant timestamp = service.getBlockTimestamp(null);
+
+        // Then
+        assertFalse(timestamp.isBefore(before));
+        verify(web3j, never()).ethGetBlockByNumber(any(), anyBoolean());
+    }
+
+    @Test
+    void testGetBlockTimestamp_concurrentLookupsShareOneRequest() throws Exception {
+        // Given
+        EthBlock.Block block = mock(EthBlock.Block.class);
+        EthBlock ethBlock = mock(EthBlock.class);
+        when(ethBlock.getBlock()).thenReturn(block);
+        when(block.getTimestamp()).thenReturn(BigInteger.valueOf(1640995200));
+        when(request.send()).thenAnswer(invocation -> {
+            Thread.sleep(100);
+            return ethBlock;
+        });
+        ExecutorService executor = Executors.newFixedThreadPool(8);
+
+        // When
+        List<Future<Instant>> lookups = new ArrayList<>();
+        for (int i = 0; i < 8; i++) {
+            lookups.add(executor.submit(() -> service.getBlockTimestamp(BigInteger.valueOf(12345))));
+        }
+
+        // Then
+        for (Future<Instant> lookup : lookups) {
+            assertEquals(Instant.ofEpochSecond(1640995200), lookup.get(5, TimeUnit.SECONDS));
+        }
+        verify(web3j, times(1)).ethGetBlockByNumber(any(), eq(false));
+        executor.shutdown();
+    }
+}
@@ -3,45 +3,81 @@ package dev.ps.ethblockevents.service;
 import com.google.common.eventbus.EventBus;
 import dev.ps.ethblockevents.config.EthereumProperties;
 import dev.ps.ethblockevents.model.BlockEvent;
+import dev.ps.ethblockevents.model.EthereumEvent;
+import io.reactivex.Flowable;
+import io.reactivex.subscribers.TestSubscriber;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
+import org.mockito.ArgumentCaptor;
 import org.mockito.Mock;
 import org.mockito.MockitoAnnotations;
 import org.web3j.protocol.Web3j;
+import org.web3j.protocol.Web3jService;
+import org.web3j.protocol.core.DefaultBlockParameter;
+import org.web3j.protocol.core.DefaultBlockParameterName;
+import org.web3j.protocol.core.DefaultBlockParameterNumber;
+import org.web3j.protocol.core.Request;
+import org.web3j.protocol.core.Response;
+import org.web3j.protocol.core.methods.request.EthFilter;
 import org.web3j.protocol.core.methods.response.EthBlock;
+import org.web3j.protocol.core.methods.response.EthBlockNumber;
+import org.web3j.protocol.core.methods.response.EthLog;
+import org.web3j.protocol.core.methods.response.Log;
+import org.web3j.protocol.websocket.events.NewHead;
+import org.web3j.protocol.websocket.events.NewHeadsNotification;
+import org.web3j.protocol.websocket.events.NotificationParams;
 
+import java.io.IOException;
 import java.math.BigInteger;
 import java.time.Instant;
+import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.Collections;
 import java.util.List;
+import java.util.Map;
+import java.util.concurrent.CopyOnWriteArrayList;
+import java.util.concurrent.TimeUnit;
+import java.util.function.BiFunction;
 
+import static org.junit.jupiter.api.Assertions.*;
 import static org.mockito.Mockito.*;
 
 class EthereumEventListenerServiceTest {
 
+    private static final String CONTRACT_ADDRESS = "0x1234567890123456789012345678901234567890";
+    private static final String TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef";
+    private static final String APPROVAL_TOPIC = "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925";
+
     @Mock
     private Web3j web3j;
     
     @Mock
     private Web3j web3jWebsocket;
     
+    @Mock
+    private Web3jService web3jWebsocketService;
+    
     @Mock
     private EventBus eventBus;
     
     @Mock
     private EthereumProperties ethereumProperties;
     
+    @Mock
+    private BlockTimestampService blockTimestampService;
+    
     @Mock
     private GenericContractEventListener mockEventListener;
 
     private EthereumEventListenerService service;
+    private final List<List<Long>> requestedRanges = new CopyOnWriteArrayList<>();
 
     @BeforeEach
     void setUp() {
         MockitoAnnotations.openMocks(this);
         List<GenericContractEventListener> eventListeners = Collections.singletonList(mockEventListener);
-        service = new EthereumEventListenerService(web3j, web3jWebsocket, eventBus, ethereumProperties, eventListeners);
+        service = new EthereumEventListenerService(web3j, web3jWebsocket, web3jWebsocketService, eventBus, ethereumProperties, blockTimestampService, eventListeners);
+        service.logRetryBackoffMillis = 0;
     }
 
     @Test
@@ -90,4 +126,365 @@ class EthereumEventListenerServiceTest {
         // Then
         verify(eventBus).post(any(BlockEvent.class));
     }
-}
\ No newline at end of file
+
+    @Test
+    void testStartBlockListening_publishesNewHeadsInOrder() {
+        // Given
+        when(ethereumProperties.websocketUrl()).thenReturn("wss://node.example");
+        Flowable<NewHeadsNotification> heads = Flowable.just(newHead("0xhash1"), newHead("0xhash2"));
+        when(web3jWebsocket.newHeadsNotifications()).thenReturn(heads);
+        stubBlockByHash("0xhash1", 100);
+        stubBlockByHash("0xhash2", 101);
+
+        // When
+        service.startBlockListening();
+
+        // Then
+        ArgumentCaptor<BlockEvent> eventCaptor = ArgumentCaptor.forClass(BlockEvent.class);
+        verify(eventBus, timeout(5000).times(2)).post(eventCaptor.capture());
+        assertEquals(BigInteger.valueOf(100), eventCaptor.getAllValues().get(0).blockNumber());
+        assertEquals(BigInteger.valueOf(101), eventCaptor.getAllValues().get(1).blockNumber());
+        service.stopListening();
+    }
+
+    @Test
+    @SuppressWarnings("unchecked")
+    void testAddDynamicContract_liveLogsSkipRemoved() {
+        // Given
+        when(ethereumProperties.websocketUrl()).thenReturn("wss://node.example");
+        Log removedLog = log(100, TRANSFER_TOPIC);
+        removedLog.setRemoved(true);
+        stubBlockNumber(99);
+        Flowable<EthereumEventListenerService.LogNotification> notifications = Flowable.just(
+            logNotification(log(100, TRANSFER_TOPIC)), logNotification(removedLog));
+        doReturn(notifications).when(web3jWebsocketService)
+            .subscribe(any(Request.class), eq("eth_unsubscribe"), eq(EthereumEventListenerService.LogNotification.class));
+
+        // When
+        service.addDynamicContract(contract(null, event("Transfer", TRANSFER_TOPIC)));
+
+        // Then
+        verify(eventBus, after(500).times(1)).post(any(EthereumEvent.class));
+
+        ArgumentCaptor<Request> requestCaptor = ArgumentCaptor.forClass(Request.class);
+        verify(web3jWebsocketService).subscribe(requestCaptor.capture(), eq("eth_unsubscribe"), any());
+        List<Object> params = requestCaptor.getValue().getParams();
+        assertEquals("eth_subscribe", requestCaptor.getValue().getMethod());
+        assertEquals("logs", params.get(0));
+        assertEquals(List.of(CONTRACT_ADDRESS), ((Map<String, Object>) params.get(1)).get("address"));
+        assertEquals(List.of(TRANSFER_TOPIC), ((Map<String, Object>) params.get(1)).get("topics"));
+        service.stopListening();
+    }
+
+    @Test
+    void testAddDynamicContract_fallsBackToPollingFromHeadAtSubscribeWhenNoLogReceived() {
+        // Given
+        when(ethereumProperties.websocketUrl()).thenReturn("wss://node.example");
+        stubBlockNumber(100);
+        doReturn(Flowable.error(new IOException("Connection was closed"))).when(web3jWebsocketService)
+            .subscribe(any(Request.class), eq("eth_unsubscribe"), eq(EthereumEventListenerService.LogNotification.class));
+        doReturn(Flowable.just(log(101, TRANSFER_TOPIC))).when(web3j).ethLogFlowable(any());
+
+        // When
+        service.addDynamicContract(contract(null, event("Transfer", TRANSFER_TOPIC)));
+
+        // Then
+        verify(eventBus, timeout(5000)).post(any(EthereumEvent.class));
+        ArgumentCaptor<EthFilter> filterCaptor = ArgumentCaptor.forClass(EthFilter.class);
+        verify(web3j).ethLogFlowable(filterCaptor.capture());
+        assertEquals(101L, blockNumber(filterCaptor.getValue().getFromBlock()));
+        service.stopListening();
+    }
+
+    @Test
+    void testAddDynamicContract_fallbackResumesWithinLastBlockWithoutDuplicates() {
+        // Given: the connection drops after the first of two logs in block 100
+        when(ethereumProperties.websocketUrl()).thenReturn("wss://node.example");
+        stubBlockNumber(100);
+        Flowable<EthereumEventListenerService.LogNotification> notifications =
+            Flowable.just(logNotification(log(100, 0, TRANSFER_TOPIC)))
+                .concatWith(Flowable.error(new IOException("Connection was closed")));
+        doReturn(notifications).when(web3jWebsocketService)
+            .subscribe(any(Request.class), eq("eth_unsubscribe"), eq(EthereumEventListenerService.LogNotification.class));
+        stubGetLogs((from, to) -> logsResponse(logObject(100, 0), logObject(100, 1)));
+        doReturn(Flowable.never()).when(web3j).ethLogFlowable(any());
+
+        // When
+        service.addDynamicContract(contract(null, event("Transfer", TRANSFER_TOPIC)));
+
+        // Then
+        ArgumentCaptor<EthereumEvent> eventCaptor = ArgumentCaptor.forClass(EthereumEvent.class);
+        verify(eventBus, after(500).times(2)).post(eventCaptor.capture());
+        assertEquals(List.of(BigInteger.ZERO, BigInteger.ONE),
+            eventCaptor.getAllValues().stream().map(EthereumEvent::logIndex).toList());
+        assertEquals(List.of(List.of(100L, 100L)), requestedRanges);
+        service.stopListening();
+    }
+
+    @Test
+    void testAddDynamicContract_mergedFilterRoutesLogsBySignature() {
+        // Given
+        when(ethereumProperties.websocketUrl()).thenReturn(null);
+        doReturn(Flowable.just(log(100, TRANSFER_TOPIC), log(101, APPROVAL_TOPIC)))
+            .when(web3j).ethLogFlowable(any());
+
+        // When
+        service.addDynamicContract(contract(null,
+            event("Transfer", TRANSFER_TOPIC.toUpperCase().replace("0X", "0x")),
+            event("Approval", APPROVAL_TOPIC)));
+
+        // Then
+        ArgumentCaptor<EthereumEvent> eventCaptor = ArgumentCaptor.forClass(EthereumEvent.class);
+        verify(eventBus, timeout(5000).times(2)).post(eventCaptor.capture());
+        assertEquals("Transfer", eventCaptor.getAllValues().get(0).eventName());
+        assertEquals("Approval", eventCaptor.getAllValues().get(1).eventName());
+        verify(web3j, times(1)).ethLogFlowable(any());
+        service.stopListening();
+    }
+
+    @Test
+    void testAddDynamicContract_mergedFilterKeepsConfigsWithSameSignature() {
+        // Given
+        when(ethereumProperties.websocketUrl()).thenReturn(null);
+        doReturn(Flowable.just(log(100, TRANSFER_TOPIC))).when(web3j).ethLogFlowable(any());
+
+        // When
+        service.addDynamicContract(contract(null,
+            event("Transfer", TRANSFER_TOPIC),
+            event("TransferAudit", TRANSFER_TOPIC)));
+
+        // Then
+        ArgumentCaptor<EthereumEvent> eventCaptor = ArgumentCaptor.forClass(EthereumEvent.class);
+        verify(eventBus, timeout(5000).times(2)).post(eventCaptor.capture());
+        assertEquals(List.of("Transfer", "TransferAudit"),
+            eventCaptor.getAllValues().stream().map(EthereumEvent::eventName).toList());
+        service.stopListening();
+    }
+
+    @Test
+    void testFilterLogFlowable_halvesRangeOnFailureAndGrowsAfterSmallResponses() {
+        // Given
+        stubBlockNumber(19_999);
+        stubGetLogs((from, to) -> from == 0 && to - from + 1 > 5_000 ? errorResponse() : logsResponse(0));
+
+        // When
+        service.filterLogFlowable(this::filter, new EthereumProperties.BlockRange(0L, 19_999L))
+            .test()
+            .awaitDone(5, TimeUnit.SECONDS)
+            .assertComplete();
+
+        // Then
+        assertEquals(List.of(
+            List.of(0L, 9_999L),      // too many results
+            List.of(0L, 4_999L),      // halved
+            List.of(5_000L, 14_999L), // doubled after a small response
+            List.of(15_000L, 19_999L) // capped at the end of the range
+        ), requestedRanges);
+    }
+
+    @Test
+    void testFilterLogFlowable_givesUpAfterRepeatedFailures() {
+        // Given
+        stubBlockNumber(100);
+        stubGetLogs((from, to) -> errorResponse());
+
+        // When
+        service.filterLogFlowable(this::filter, new EthereumProperties.BlockRange(0L, 100L))
+            .test()
+            .awaitDone(5, TimeUnit.SECONDS)
+            .assertError(IOException.class);
+
+        // Then
+        assertEquals(20, requestedRanges.size());
+        assertEquals(List.of(0L, 0L), requestedRanges.get(requestedRanges.size() - 1));
+    }
+
+    @Test
+    void testFilterLogFlowable_followsBoundedRangePastHeadLive() {
+        // Given
+        stubBlockNumber(150);
+        stubGetLogs((from, to) -> logsResponse(1));
+        doReturn(Flowable.just(log(160, TRANSFER_TOPIC))).when(web3j).ethLogFlowable(any());
+
+        // When
+        service.filterLogFlowable(this::filter, new EthereumProperties.BlockRange(100L, 200L))
+            .test()
+            .awaitDone(5, TimeUnit.SECONDS)
+            .assertComplete()
+            .assertValueCount(2);
+
+        // Then
+        assertEquals(List.of(List.of(100L, 150L)), requestedRanges);
+        ArgumentCaptor<EthFilter> filterCaptor = ArgumentCaptor.forClass(EthFilter.class);
+        verify(web3j).ethLogFlowable(filterCaptor.capture());
+        assertEquals(151L, blockNumber(filterCaptor.getValue().getFromBlock()));
+        assertEquals(200L, blockNumber(filterCaptor.getValue().getToBlock()));
+    }
+
+    @Test
+    void testFilterLogFlowable_handsOpenRangeOverToLiveFilterAtHead() {
+        // Given
+        stubBlockNumber(150);
+        stubGetLogs((from, to) -> logsResponse(0));
+        doReturn(Flowable.empty()).when(web3j).ethLogFlowable(any());
+
+        // When
+        service.filterLogFlowable(this::filter, new EthereumProperties.BlockRange(100L, null))
+            .test()
+            .awaitDone(5, TimeUnit.SECONDS)
+            .assertComplete();
+
+        // Then
+        assertEquals(List.of(List.of(100L, 150L)), requestedRanges);
+        ArgumentCaptor<EthFilter> filterCaptor = ArgumentCaptor.forClass(EthFilter.class);
+        verify(web3j).ethLogFlowable(filterCaptor.capture());
+        assertEquals(151L, blockNumber(filterCaptor.getValue().getFromBlock()));
+        assertEquals(DefaultBlockParameterName.LATEST, filterCaptor.getValue().getToBlock());
+    }
+
+    @Test
+    void testFilterLogFlowable_fetchesChunksOnDemand() throws InterruptedException {
+        // Given
+        stubBlockNumber(10_000_000);
+        stubGetLogs((from, to) -> logsResponse(3));
+
+        // When
+        TestSubscriber<Log> subscriber = service
+            .filterLogFlowable(this::filter, new EthereumProperties.BlockRange(0L, null))
+            .test(1);
+        subscriber.awaitCount(1);
+        Thread.sleep(200);
+
+        // Then
+        subscriber.assertValueCount(1);
+        assertTrue(requestedRanges.size() <= 2, "fetched " + requestedRanges.size() + " chunks for one log");
+        subscriber.cancel();
+    }
+
+    private EthFilter filter(DefaultBlockParameter from, DefaultBlockParameter to) {
+        return new EthFilter(from, to, CONTRACT_ADDRESS);
+    }
+
+    private void stubBlockNumber(long blockNumber) {
+        EthBlockNumber response = new EthBlockNumber();
+        response.setResult("0x" + Long.toHexString(blockNumber));
+        doReturn(respondingWith(response)).when(web3j).ethBlockNumber();
+    }
+
+    private void stubGetLogs(BiFunction<Long, Long, EthLog> responder) {
+        doAnswer(invocation -> {
+            EthFilter filter = invocation.getArgument(0);
+            long from = blockNumber(filter.getFromBlock());
+            long to = blockNumber(filter.getToBlock());
+            requestedRanges.add(List.of(from, to));
+            return respondingWith(responder.apply(from, to));
+        }).when(web3j).ethGetLogs(any());
+    }
+
+    private static <T extends Response<?>> Request<Object, T> respondingWith(T response) {
+        return new Request<>() {
+            @Override
+            public T send() {
+                return response;
+            }
+        };
+    }
+
+    private static long blockNumber(DefaultBlockParameter parameter) {
+        return ((DefaultBlockParameterNumber) parameter).getBlockNumber().longValue();
+    }
+
+    private static EthLog logsResponse(int count) {
+        List<EthLog.LogResult> logs = new ArrayList<>();
+        for (int i = 0; i < count; i++) {
+            EthLog.LogObject log = new EthLog.LogObject();
+            log.setTopics(List.of(TRANSFER_TOPIC));
+            logs.add(log);
+        }
+        EthLog response = new EthLog();
+        response.setResult(logs);
+        return response;
+    }
+
+    private static EthLog logsResponse(EthLog.LogObject... logs) {
+        EthLog response = new EthLog();
+        response.setResult(List.<EthLog.LogResult>of(logs));
+        return response;
+    }
+
+    private static EthLog.LogObject logObject(long blockNumber, long logIndex) {
+        EthLog.LogObject log = new EthLog.LogObject();
+        log.setAddress(CONTRACT_ADDRESS);
+        log.setBlockNumber("0x" + Long.toHexString(blockNumber));
+        log.setLogIndex("0x" + Long.toHexString(logIndex));
+        log.setTopics(List.of(TRANSFER_TOPIC));
+        log.setData("0x");
+        return log;
+    }
+
+    private static EthLog errorResponse() {
+        EthLog response = new EthLog();
+        response.setError(new Response.Error(-32005, "query returned more than 10000 results"));
+        return response;
+    }
+
+    private static EthereumProperties.EventConfig event(String name, String signature) {
+        return new EthereumProperties.EventConfig(name, signature, Collections.emptyList(), true);
+    }
+
+    private static EthereumProperties.ContractConfig contract(EthereumProperties.BlockRange blockRange,
+                                                              EthereumProperties.EventConfig... events) {
+        return new EthereumProperties.ContractConfig("Token", CONTRACT_ADDRESS, Arrays.asList(events), blockRange);
+    }
+
+    private static Log log(long blockNumber, long logIndex, String topic0) {
+        Log log = log(blockNumber, topic0);
+        log.setLogIndex("0x" + Long.toHexString(logIndex));
+        return log;
+    }
+
+    private static Log log(long blockNumber, String topic0) {
+        Log log = new Log();
+        log.setAddress(CONTRACT_ADDRESS);
+        log.setBlockNumber("0x" + Long.toHexString(blockNumber));
+        log.setTopics(List.of(topic0));
+        log.setData("0x");
+        return log;
+    }
+
+    @SuppressWarnings("unchecked")
+    private static EthereumEventListenerService.LogNotification logNotification(Log log) {
+        NotificationParams<Log> params = mock(NotificationParams.class);
+        when(params.getResult()).thenReturn(log);
+        EthereumEventListenerService.LogNotification notification =
+            mock(EthereumEventListenerService.LogNotification.class);
+        when(notification.getParams()).thenReturn(params);
+        return notification;
+    }
+
+    @SuppressWarnings("unchecked")
+    private NewHeadsNotification newHead(String blockHash) {
+        NewHead head = mock(NewHead.class);
+        when(head.getHash()).thenReturn(blockHash);
+        NotificationParams<NewHead> params = mock(NotificationParams.class);
+        when(params.getResult()).thenReturn(head);
+        NewHeadsNotification notification = mock(NewHeadsNotification.class);
+        when(notification.getParams()).thenReturn(params);
+        return notification;
+    }
+
+    @SuppressWarnings("unchecked")
+    private void stubBlockByHash(String blockHash, long blockNumber) {
+        EthBlock.Block block = mock(EthBlock.Block.class);
+        when(block.getNumber()).thenReturn(BigInteger.valueOf(blockNumber));
+        when(block.getHash()).thenReturn(blockHash);
+        when(block.getTimestamp()).thenReturn(BigInteger.valueOf(1640995200));
+        when(block.getTransactions()).thenReturn(Collections.emptyList());
+        EthBlock ethBlock = mock(EthBlock.class);
+        when(ethBlock.getBlock()).thenReturn(block);
+
+        Request<?, EthBlock> request = mock(Request.class);
+        doReturn(Flowable.just(ethBlock)).when(request).flowable();
+        doReturn(request).when(web3jWebsocket).ethGetBlockByHash(eq(blockHash), eq(false));
+    }
+}
@@ -2,13 +2,22 @@ package dev.ps.ethblockevents.service;
 
 import com.google.common.eventbus.EventBus;
 import dev.ps.ethblockevents.config.EthereumProperties;
+import dev.ps.ethblockevents.model.UniswapInitializeEvent;
+import dev.ps.ethblockevents.model.UniswapModifyLiquidityEvent;
 import dev.ps.ethblockevents.model.UniswapSwapEvent;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 import org.mockito.ArgumentCaptor;
 import org.mockito.Mock;
 import org.mockito.MockitoAnnotations;
-import org.web3j.protocol.Web3j;
+import org.web3j.abi.FunctionEncoder;
+import org.web3j.abi.datatypes.Address;
+import org.web3j.abi.datatypes.generated.Int128;
+import org.web3j.abi.datatypes.generated.Int24;
+import org.web3j.abi.datatypes.generated.Int256;
+import org.web3j.abi.datatypes.generated.Uint128;
+import org.web3j.abi.datatypes.generated.Uint160;
+import org.web3j.abi.datatypes.generated.Uint24;
 import org.web3j.protocol.core.methods.response.Log;
 
 import java.math.BigInteger;
@@ -24,7 +33,7 @@ class UniswapEventListenerTest {
     private EventBus eventBus;
     
     @Mock
-    private Web3j web3j;
+    private BlockTimestampService blockTimestampService;
     
     @Mock
     private Log mockLog;
@@ -34,7 +43,7 @@ class UniswapEventListenerTest {
     @BeforeEach
     void setUp() {
         MockitoAnnotations.openMocks(this);
-        listener = new UniswapEventListener(eventBus, web3j);
+        listener = new UniswapEventListener(eventBus, blockTimestampService);
     }
 
     @Test
@@ -118,6 +127,139 @@ class UniswapEventListenerTest {
         assertEquals("0x1234567890123456789012345678901234567890", capturedEvent.sender());
     }
 
+    @Test
+    void testHandleSwapEvent_decodesData() {
+        // Given
+        String data = "0x" + FunctionEncoder.encodeConstructor(Arrays.asList(
+            new Int128(BigInteger.valueOf(-1000)),
+            new Int128(BigInteger.valueOf(2500)),
+            new Uint160(BigInteger.valueOf(79228162514264337L)),
+            new Uint128(BigInteger.valueOf(123456789)),
+            new Int24(BigInteger.valueOf(-887))
+        ));
+        when(mockLog.getTopics()).thenReturn(Arrays.asList(
+            UniswapSwapEvent.TOPIC_0,
+            "0x1234567890123456789012345678901234567890123456789012345678901234", // poolId
+            "0x0000000000000000000000001234567890123456789012345678901234567890"  // sender
+        ));
+        when(mockLog.getAddress()).thenReturn("0xUniswapContract");
+        when(mockLog.getTransactionHash()).thenReturn("0xTxHash");
+        when(mockLog.getBlockNumber()).thenReturn(BigInteger.valueOf(12345));
+        when(mockLog.getLogIndex()).thenReturn(BigInteger.valueOf(1));
+        when(mockLog.getData()).thenReturn(data);
+
+        EthereumProperties.EventConfig eventConfig = new EthereumProperties.EventConfig(
+            "Swap", UniswapSwapEvent.TOPIC_0, Collections.emptyList(), true
+        );
+        EthereumProperties.ContractConfig contractConfig = new EthereumProperties.ContractConfig(
+            "UniswapV4", "0xUniswapContract", Collections.singletonList(eventConfig), null
+        );
+
+        // When
+        boolean handled = listener.handleEvent(mockLog, contractConfig, eventConfig);
+
+        // Then
+        assertTrue(handled);
+        
+        ArgumentCaptor<UniswapSwapEvent> eventCaptor = ArgumentCaptor.forClass(UniswapSwapEvent.class);
+        verify(eventBus).post(eventCaptor.capture());
+        
+        UniswapSwapEvent capturedEvent = eventCaptor.getValue();
+        assertEquals(BigInteger.valueOf(-1000), capturedEvent.amount0());
+        assertEquals(BigInteger.valueOf(2500), capturedEvent.amount1());
+        assertEquals(BigInteger.valueOf(79228162514264337L), capturedEvent.sqrtPriceX96());
+        assertEquals(BigInteger.valueOf(123456789), capturedEvent.liquidity());
+        assertEquals(BigInteger.valueOf(-887), capturedEvent.tick());
+    }
+
+    @Test
+    void testHandleInitializeEvent_decodesData() {
+        // Given
+        String hooks = "0x00000000000000000000000000000000000000aa";
+        String data = "0x" + FunctionEncoder.encodeConstructor(Arrays.asList(
+            new Uint24(BigInteger.valueOf(3000)),
+            new Int24(BigInteger.valueOf(-60)),
+            new Address(hooks)
+        ));
+        when(mockLog.getTopics()).thenReturn(Arrays.asList(
+            UniswapInitializeEvent.TOPIC_0,
+            "0x1234567890123456789012345678901234567890123456789012345678901234", // poolId
+            "0x000000000000000000000000a0b86991c6218b36c1d19d4a2e9eb0ce3606eb48", // currency0
+            "0x000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"  // currency1
+        ));
+        when(mockLog.getAddress()).thenReturn("0xUniswapContract");
+        when(mockLog.getTransactionHash()).thenReturn("0xTxHash");
+        when(mockLog.getBlockNumber()).thenReturn(BigInteger.valueOf(12345));
+        when(mockLog.getLogIndex()).thenReturn(BigInteger.valueOf(1));
+        when(mockLog.getData()).thenReturn(data);
+
+        EthereumProperties.EventConfig eventConfig = new EthereumProperties.EventConfig(
+            "Initialize", UniswapInitializeEvent.TOPIC_0, Collections.emptyList(), true
+        );
+        EthereumProperties.ContractConfig contractConfig = new EthereumProperties.ContractConfig(
+            "UniswapV4", "0xUniswapContract", Collections.singletonList(eventConfig), null
+        );
+
+        // When
+        boolean handled = listener.handleEvent(mockLog, contractConfig, eventConfig);
+
+        // Then
+        assertTrue(handled);
+        
+        ArgumentCaptor<UniswapInitializeEvent> eventCaptor = ArgumentCaptor.forClass(UniswapInitializeEvent.class);
+        verify(eventBus).post(eventCaptor.capture());
+        
+        UniswapInitializeEvent capturedEvent = eventCaptor.getValue();
+        assertEquals("0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48", capturedEvent.currency0());
+        assertEquals("0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2", capturedEvent.currency1());
+        assertEquals(BigInteger.valueOf(3000), capturedEvent.fee());
+        assertEquals(BigInteger.valueOf(-60), capturedEvent.tickSpacing());
+        assertEquals(hooks, capturedEvent.hooks());
+    }
+
+    @Test
+    void testHandleModifyLiquidityEvent_decodesData() {
+        // Given
+        BigInteger liquidityDelta = BigInteger.TWO.pow(100).negate();
+        String data = "0x" + FunctionEncoder.encodeConstructor(Arrays.asList(
+            new Int24(BigInteger.valueOf(-887220)),
+            new Int24(BigInteger.valueOf(887220)),
+            new Int256(liquidityDelta)
+        ));
+        when(mockLog.getTopics()).thenReturn(Arrays.asList(
+            UniswapModifyLiquidityEvent.TOPIC_0,
+            "0x1234567890123456789012345678901234567890123456789012345678901234", // poolId
+            "0x0000000000000000000000001234567890123456789012345678901234567890"  // sender
+        ));
+        when(mockLog.getAddress()).thenReturn("0xUniswapContract");
+        when(mockLog.getTransactionHash()).thenReturn("0xTxHash");
+        when(mockLog.getBlockNumber()).thenReturn(BigInteger.valueOf(12345));
+        when(mockLog.getLogIndex()).thenReturn(BigInteger.valueOf(1));
+        when(mockLog.getData()).thenReturn(data);
+
+        EthereumProperties.EventConfig eventConfig = new EthereumProperties.EventConfig(
+            "ModifyLiquidity", UniswapModifyLiquidityEvent.TOPIC_0, Collections.emptyList(), true
+        );
+        EthereumProperties.ContractConfig contractConfig = new EthereumProperties.ContractConfig(
+            "UniswapV4", "0xUniswapContract", Collections.singletonList(eventConfig), null
+        );
+
+        // When
+        boolean handled = listener.handleEvent(mockLog, contractConfig, eventConfig);
+
+        // Then
+        assertTrue(handled);
+        
+        ArgumentCaptor<UniswapModifyLiquidityEvent> eventCaptor = ArgumentCaptor.forClass(UniswapModifyLiquidityEvent.class);
+        verify(eventBus).post(eventCaptor.capture());
+        
+        UniswapModifyLiquidityEvent capturedEvent = eventCaptor.getValue();
+        assertEquals("0x1234567890123456789012345678901234567890", capturedEvent.sender());
+        assertEquals(BigInteger.valueOf(-887220), capturedEvent.tickLower());
+        assertEquals(BigInteger.valueOf(887220), capturedEvent.tickUpper());
+        assertEquals(liquidityDelta, capturedEvent.liquidityDelta());
+    }
+
     @Test
     void testGetPriority() {
         // When